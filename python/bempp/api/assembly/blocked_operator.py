@@ -162,6 +162,7 @@ class BlockedDiscreteOperator(LinearOperator):
         self._operators = _np.empty((m, n), dtype=_np.object)
         self._rows = _np.zeros(m, dtype=int)
         self._cols = _np.zeros(n, dtype=int)
+        self._dtype = None
 
     def __getitem__(self, key):
 
@@ -181,6 +182,7 @@ class BlockedDiscreteOperator(LinearOperator):
         else:
             self._cols[key[1]] = operator.shape[1]
         self._operators[key] = operator
+        self._dtype = None
 
     def _fill_complete(self):
 
@@ -194,8 +196,9 @@ class BlockedDiscreteOperator(LinearOperator):
         from bempp.api.utils.data_types import combined_type
 
         if x.ndim == 1:
-            x_new = _np.expand_dims(x, 1)
-            return self.matvec(x_new).ravel()
+            # Calling _matvec directly avoids a second round of the shape
+            # checks and conversions in matvec.
+            return self._matvec(x[:, _np.newaxis]).ravel()
 
         if not self._fill_complete():
             raise ValueError("Not all rows or columns contain operators.")
@@ -211,14 +214,22 @@ class BlockedDiscreteOperator(LinearOperator):
                 if self._operators[i, j] is not None:
                     op_is_complex = _np.iscomplexobj(self._operators[i, j].dtype.type(1))
                     if _np.iscomplexobj(x) and not op_is_complex:
-                        local_res[:] += (self._operators[i, j].dot(_np.real(local_x)) +
-                                         1j * self._operators[i, j].dot(_np.imag(local_x)))
+                        # Accumulate into the real and imaginary parts in place
+                        # instead of forming the complex product first.
+                        res_real = local_res.real
+                        res_imag = local_res.imag
+                        res_real += self._operators[i, j].dot(_np.real(local_x))
+                        res_imag += self._operators[i, j].dot(_np.imag(local_x))
                     else:
-                        local_res[:] += self._operators[i, j].dot(local_x)
+                        local_res += self._operators[i, j].dot(local_x)
                 col_dim += self._cols[j]
             row_dim += self._rows[i]
         return res
 
+    def _matmat(self, x):
+        """Multiply with all columns of x at once."""
+        return self._matvec(x)
+
     def _get_shape(self):
         return (_np.sum(self._rows), _np.sum(self._cols))
 
@@ -226,12 +237,16 @@ class BlockedDiscreteOperator(LinearOperator):
 
         from bempp.api.utils.data_types import combined_type
 
-        d = 'float64'
-        for obj in self._operators.ravel():
-            if obj is not None:
-                d = combined_type(d, obj.dtype)
+        # The dtype is needed in every product. It is cached until the
+        # next block is set.
+        if self._dtype is None:
+            d = 'float64'
+            for obj in self._operators.ravel():
+                if obj is not None:
+                    d = combined_type(d, obj.dtype)
+            self._dtype = _np.dtype(d)
 
-        return d
+        return self._dtype
 
     def _get_ndims(self):
 
@@ -409,8 +409,40 @@ class _SumBoundaryOperator(BoundaryOperator):
         self._op1 = op1
         self._op2 = op2
 
+    def _terms(self):
+        """Return the (alpha, operator) pairs whose weighted sum is this operator.
+
+        Nested sums and scalings are flattened. Scaled copies of the same
+        operator object are merged into one term.
+
+        """
+        terms = []
+        stack = [(self, 1)]
+        while stack:
+            op, alpha = stack.pop()
+            if isinstance(op, _SumBoundaryOperator):
+                stack.append((op._op2, alpha))
+                stack.append((op._op1, alpha))
+            elif isinstance(op, _ScaledBoundaryOperator):
+                stack.append((op._op, alpha * op._alpha))
+            else:
+                for term in terms:
+                    if term[1] is op:
+                        term[0] += alpha
+                        break
+                else:
+                    terms.append([alpha, op])
+        return terms
+
     def _weak_form_impl(self):
-        return self._op1.weak_form() + self._op2.weak_form()
+        # Each distinct operator appears once in the discrete sum, so that
+        # e.g. the weak form of kappa * slp + slp / kappa is applied only
+        # once per product.
+        weak_form = None
+        for alpha, op in self._terms():
+            term = op.weak_form() if alpha == 1 else op.weak_form() * alpha
+            weak_form = term if weak_form is None else weak_form + term
+        return weak_form
 
 
 class _ScaledBoundaryOperator(BoundaryOperator):
@@ -472,10 +504,16 @@ class _AdjointBoundaryOperator(BoundaryOperator):
 
 
 class CompoundBoundaryOperator(BoundaryOperator):
-    """Create a compound boundary operator."""
+    """Create a compound boundary operator.
+
+    The scalar `scale` is multiplied into the assembled test local
+    operators, which avoids wrapping the compound operator in a
+    scaled operator.
+
+    """
 
     def __init__(self, test_local_ops, kernel_op, trial_local_ops,
-                 parameters=None, label=""):
+                 parameters=None, label="", scale=1.0):
 
         import bempp
 
@@ -511,6 +549,7 @@ class CompoundBoundaryOperator(BoundaryOperator):
         self._trial_local_ops = trial_local_ops
         self._kernel_op = kernel_op
         self._number_of_ops = len(test_local_ops)
+        self._scale = scale
 
     def _weak_form_impl(self):
 
@@ -532,7 +571,10 @@ class CompoundBoundaryOperator(BoundaryOperator):
 
         kernel_discrete_op = self._kernel_op.weak_form()
         for i in range(self._number_of_ops):
-            discrete_op += (self._test_local_ops[i].weak_form() * test_inverse * kernel_discrete_op *
+            test_discrete_op = self._test_local_ops[i].weak_form()
+            if self._scale != 1:
+                test_discrete_op = self._scale * test_discrete_op
+            discrete_op += (test_discrete_op * test_inverse * kernel_discrete_op *
                             trial_inverse * self._trial_local_ops[i].weak_form())
         return discrete_op
 
@@ -89,6 +89,101 @@ class DenseDiscreteBoundaryOperator(_MatrixLinearOperator): # pylint: disable=to
         return DenseDiscreteBoundaryOperator(self.A.conjugate().transpose())
 
 
+class _CuPyLinearOperator(_LinearOperator):
+    """Dense operator whose block products are computed on a GPU with CuPy.
+
+    The matrix is copied to the device on the first block product.
+    Matrix-vector products are computed on the host. CuPy is imported
+    on construction.
+
+    Parameters
+    ----------
+    mat : np.ndarray
+        The dense matrix of the operator.
+
+    """
+
+    def __init__(self, mat):
+
+        import cupy
+
+        super(_CuPyLinearOperator, self).__init__(dtype=mat.dtype, shape=mat.shape)
+
+        self._cupy = cupy
+        self._mat = mat
+        self._device_mat = None
+
+    def _matvec(self, vec):
+        """Multiply the operator on the host with a vector."""
+
+        return self._mat.dot(vec)
+
+    def _matmat(self, mat):
+        """Multiply the operator on the device with the dense matrix mat."""
+
+        cupy = self._cupy
+
+        if self._device_mat is None:
+            self._device_mat = cupy.asarray(self._mat)
+
+        return cupy.asnumpy(cupy.matmul(self._device_mat, cupy.asarray(mat)))
+
+    def _adjoint(self):
+        """Adjoint of the operator.
+
+        The adjoint stores a new conjugate transposed matrix on the host.
+        Its first block product makes a second copy on the device.
+
+        """
+
+        return _CuPyLinearOperator(self._mat.conjugate().transpose())
+
+
+class _SinglePrecisionLinearOperator(_LinearOperator):
+    """Apply a single precision operator to double precision data.
+
+    Inputs are cast down to single precision before they are passed to
+    the wrapped operator and results are cast back up. This halves the
+    memory traffic of memory bound products at the cost of accuracy,
+    which is acceptable e.g. for preconditioners.
+
+    Parameters
+    ----------
+    operator : scipy.sparse.linalg.interface.LinearOperator
+        An operator of dtype float32 or complex64.
+
+    """
+
+    def __init__(self, operator):
+
+        super(_SinglePrecisionLinearOperator, self).__init__(
+            dtype=_np.result_type(operator.dtype, _np.float64), shape=operator.shape)
+
+        self._operator = operator
+
+    def _apply(self, fun, vec):
+        """Apply fun in single precision."""
+
+        single_dtype = _np.complex64 if _np.iscomplexobj(vec) else _np.float32
+        result = fun(vec.astype(single_dtype))
+        return result.astype(_np.result_type(self.dtype, vec.dtype))
+
+    def _matvec(self, vec):
+        """Implements matrix-vector product."""
+
+        return self._apply(self._operator.matvec, vec)
+
+    def _matmat(self, mat):
+        """Implements matrix-matrix product."""
+
+        return self._apply(self._operator.matmat, mat)
+
+    def _adjoint(self):
+        """Adjoint of the operator."""
+
+        return _SinglePrecisionLinearOperator(self._operator.H)
+
+
 class SparseDiscreteBoundaryOperator(_LinearOperator):
     """Main class for the discrete form of sparse operators.
 
@@ -102,6 +197,8 @@ class SparseDiscreteBoundaryOperator(_LinearOperator):
         super(SparseDiscreteBoundaryOperator, self).__init__(dtype=impl.dtype, shape=impl.shape)
 
         self._impl = impl
+        self._transpose_op = None
+        self._adjoint_op = None
 
     def _matvec(self, vec):
         """Multiply the operator with a numpy vector or matrix x."""
@@ -116,12 +213,25 @@ class SparseDiscreteBoundaryOperator(_LinearOperator):
         return self._matvec(mat)
 
     def _transpose(self):
-        """Return the transpose of the discrete operator."""
-        return SparseDiscreteBoundaryOperator(self._impl.transpose())
+        """Return the transpose of the discrete operator.
+
+        The transpose shares the data and index arrays with this operator
+        and is cached, so that repeated transposition is free.
+
+        """
+        if self._transpose_op is None:
+            self._transpose_op = SparseDiscreteBoundaryOperator(self._impl.transpose())
+            self._transpose_op._transpose_op = self
+        return self._transpose_op
 
     def _adjoint(self):
         """Return the adjoint of the discrete operator."""
-        return SparseDiscreteBoundaryOperator(self._impl.transpose().conjugate())
+        if self.dtype.kind != 'c':
+            return self._transpose()
+        if self._adjoint_op is None:
+            self._adjoint_op = SparseDiscreteBoundaryOperator(self._impl.transpose().conjugate())
+            self._adjoint_op._adjoint_op = self
+        return self._adjoint_op
 
     def __add__(self, other):
 
@@ -195,38 +305,55 @@ class InverseSparseDiscreteBoundaryOperator(_LinearOperator):
 
             from scipy.sparse.linalg import splu
             self._solve_fun = None
+            self._solve_adjoint_fun = None
             self._shape = (mat.shape[1], mat.shape[0])
             self._dtype = mat.dtype
 
+            # The adjoint is applied with the same factorization. The
+            # normal equation matrices below are Hermitian.
             if mat.shape[0] == mat.shape[1]:
                 # Square matrix case
                 solver = splu(mat)
                 self._solve_fun = solver.solve
+                self._solve_adjoint_fun = lambda x: solver.solve(x, trans='H')
             elif mat.shape[0] > mat.shape[1]:
                 # Thin matrix case
                 mat_hermitian = mat.conjugate().transpose()
                 solver = splu((mat_hermitian*mat).tocsc())
                 self._solve_fun = lambda x: solver.solve(mat_hermitian*x)
+                self._solve_adjoint_fun = lambda x: mat*solver.solve(x)
             else:
                 # Thick matrix case
 
                 mat_hermitian = mat.conjugate().transpose()
                 solver = splu((mat*mat_hermitian).tocsc())
                 self._solve_fun = lambda x: mat_hermitian*solver.solve(x)
+                self._solve_adjoint_fun = lambda x: solver.solve(mat*x)
 
-        def solve(self, vec):
-            """Solve with right-hand side vec."""
+        def _apply(self, fun, vec, rows):
+            """Apply fun to vec, reshaping the result to rows rows."""
 
             if self._dtype == 'float64' and _np.iscomplexobj(vec):
-                return self.solve(_np.real(vec))+1j*self.solve(_np.imag(vec))
+                return (self._apply(fun, _np.real(vec), rows) +
+                        1j*self._apply(fun, _np.imag(vec), rows))
 
-            result = self._solve_fun(vec.squeeze())
+            result = fun(vec.squeeze())
 
             if vec.ndim > 1:
-                return result.reshape(self.shape[0], 1)
+                return result.reshape(rows, -1)
             else:
                 return result
 
+        def solve(self, vec):
+            """Solve with right-hand side vec."""
+
+            return self._apply(self._solve_fun, vec, self._shape[0])
+
+        def solve_adjoint(self, vec):
+            """Apply the adjoint of the inverse to vec."""
+
+            return self._apply(self._solve_adjoint_fun, vec, self._shape[1])
+
         @property
         def shape(self):
             """Return the shape of the inverse operator."""
@@ -249,6 +376,48 @@ class InverseSparseDiscreteBoundaryOperator(_LinearOperator):
 
         return self._solver.solve(vec)
 
+    def _matmat(self, mat): #pylint: disable=method-hidden
+        """Solve for all columns of mat at once."""
+
+        return self._solver.solve(mat)
+
+    def _adjoint(self):
+        """Return the inverse of the adjoint operator."""
+
+        return _AdjointInverseSparseDiscreteBoundaryOperator(self)
+
+
+class _AdjointInverseSparseDiscreteBoundaryOperator(_LinearOperator):
+    """Adjoint of an InverseSparseDiscreteBoundaryOperator.
+
+    The adjoint is applied with the factorization of the original
+    operator, so that taking the adjoint is cheap.
+
+    """
+
+    def __init__(self, inverse):
+
+        self._inverse = inverse
+
+        super(_AdjointInverseSparseDiscreteBoundaryOperator, self).__init__(\
+                dtype=inverse.dtype, shape=(inverse.shape[1], inverse.shape[0]))
+
+    def _matvec(self, vec): #pylint: disable=method-hidden
+        """Implemententation of matvec."""
+
+        return self._inverse._solver.solve_adjoint(vec)
+
+    def _matmat(self, mat): #pylint: disable=method-hidden
+        """Apply the adjoint to all columns of mat at once."""
+
+        return self._inverse._solver.solve_adjoint(mat)
+
+    def _adjoint(self):
+        """Return the original inverse operator."""
+
+        return self._inverse
+
+
 class ZeroDiscreteBoundaryOperator(_LinearOperator):
     """A discrete operator that represents a zero operator.
 
@@ -276,6 +445,10 @@ class ZeroDiscreteBoundaryOperator(_LinearOperator):
         else:
             return _np.zeros(self.shape[0], dtype='float64')
 
+    def _matmat(self, mat):
+        """Multiply operator with the dense numpy matrix mat."""
+        return self._matvec(mat)
+
 
 class DiscreteRankOneOperator(_LinearOperator):
     """Creates a discrete rank one operator.
@@ -318,6 +491,10 @@ class DiscreteRankOneOperator(_LinearOperator):
         else:
             return self._column * np.dot(self._row, x)
 
+    def _matmat(self, mat):
+        """Multiply operator with the dense numpy matrix mat."""
+        return self._matvec(mat)
+
     def _transpose(self, x):
 
         return DiscreteRankOneOperator(row, column)
@@ -0,0 +1,63 @@
+from unittest import TestCase
+import numpy as np
+
+
+def _counting_operator(mat):
+    """Return a linear operator for mat and the list of its block products."""
+    from scipy.sparse.linalg import LinearOperator
+
+    calls = []
+
+    def matmat(x):
+        calls.append(x.shape)
+        return mat.dot(x)
+
+    return LinearOperator(mat.shape, matvec=mat.dot, matmat=matmat, dtype=mat.dtype), calls
+
+
+class TestBlockedDiscreteOperator(TestCase):
+
+    def setUp(self):
+        from bempp.api.assembly.blocked_operator import BlockedDiscreteOperator
+
+        np.random.seed(0)
+        self._mats = [[np.random.rand(4, 3), np.random.rand(4, 2)],
+                      [np.random.rand(5, 3), None]]
+        self._calls = []
+        self._op = BlockedDiscreteOperator(2, 2)
+        for i in range(2):
+            for j in range(2):
+                if self._mats[i][j] is not None:
+                    op, calls = _counting_operator(self._mats[i][j])
+                    self._op[i, j] = op
+                    self._calls.append(calls)
+        self._mat = np.vstack([np.hstack(self._mats[0]),
+                               np.hstack([self._mats[1][0], np.zeros((5, 2))])])
+
+    def test_matmat_applies_each_block_once(self):
+        x = np.random.rand(5, 4)
+
+        self.assertAlmostEqual(np.linalg.norm(self._op * x - self._mat.dot(x)), 0)
+        self.assertEqual([len(calls) for calls in self._calls], [1, 1, 1])
+
+    def test_real_blocks_with_complex_vectors(self):
+        x = np.random.rand(5, 2) + 1j * np.random.rand(5, 2)
+
+        actual = self._op * x
+
+        self.assertEqual(actual.dtype, np.complex128)
+        self.assertAlmostEqual(np.linalg.norm(actual - self._mat.dot(x)), 0)
+
+    def test_dtype_is_updated_when_block_is_set(self):
+        self.assertEqual(self._op.dtype, np.float64)
+
+        self._op[1, 1] = _counting_operator(np.ones((5, 2), dtype='complex128'))[0]
+
+        self.assertEqual(self._op.dtype, np.complex128)
+
+    def test_matvec_with_1d_and_2d_vectors(self):
+        x = np.random.rand(5)
+
+        self.assertEqual((self._op * x).shape, (9,))
+        self.assertEqual((self._op * x[:, np.newaxis]).shape, (9, 1))
+        self.assertAlmostEqual(np.linalg.norm(self._op * x - self._mat.dot(x)), 0)
@@ -75,6 +75,33 @@ class TestBoundaryOperator(TestCase):
         self.assertIsInstance(operator_sum.weak_form(), _SumLinearOperator,
                               "A _SumLinearOperator instance is expected here.")
 
+    def test_weak_form_of_sum_of_scaled_copies_is_scaled_discrete_operator(self):
+        from bempp.api.utils.linear_operator import _ScaledLinearOperator
+        import numpy as np
+
+        operator_sum = 2.0 * self._elementary_operator + (self._elementary_operator - 0.5 * self._local_operator)
+        terms = operator_sum._terms()
+
+        self.assertEqual([alpha for alpha, _ in terms], [3.0, -0.5])
+        self.assertIs(terms[0][1], self._elementary_operator)
+        self.assertIs(terms[1][1], self._local_operator)
+
+        scaled_sum = 2.0 * self._elementary_operator + self._elementary_operator
+        weak_form = scaled_sum.weak_form()
+        vec = np.random.rand(self.domain.global_dof_count)
+
+        self.assertIsInstance(weak_form, _ScaledLinearOperator)
+        self.assertAlmostEqual(np.linalg.norm(
+            weak_form * vec - 3.0 * (self._elementary_operator.weak_form() * vec)), 0)
+
+    def test_sum_of_equal_but_distinct_operators_is_not_merged(self):
+        import bempp
+
+        op1 = bempp.api.operators.boundary.laplace.single_layer(self.domain, self.range_, self.dual_to_range)
+        op2 = bempp.api.operators.boundary.laplace.single_layer(self.domain, self.range_, self.dual_to_range)
+
+        self.assertEqual(len((op1 + op2)._terms()), 2)
+
     def test_weak_form_of_scaled_operator_is_scaled_discrete_operator(self):
         from bempp.api.utils.linear_operator import _ScaledLinearOperator
 
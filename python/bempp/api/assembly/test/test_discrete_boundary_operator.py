@@ -207,6 +207,41 @@ class TestSparseDiscreteBoundaryOperator(TestCase):
         self.assertAlmostEqual(np.linalg.norm(actual - expected), 0)
 
 
+class TestSparseDiscreteBoundaryOperatorTranspose(TestCase):
+    """Test cases for the transpose and adjoint of sparse discrete operators."""
+
+    def setUp(self):
+        import numpy as np
+        from scipy.sparse import csr_matrix
+        from bempp.api.assembly.discrete_boundary_operator import SparseDiscreteBoundaryOperator
+
+        mat = np.random.rand(6, 4)
+        mat[mat < 0.5] = 0
+        self._real_mat = mat
+        self._complex_mat = mat + 1j * mat[::-1, ::-1]
+        self._real_op = SparseDiscreteBoundaryOperator(csr_matrix(self._real_mat))
+        self._complex_op = SparseDiscreteBoundaryOperator(csr_matrix(self._complex_mat))
+
+    def test_transpose_is_cached(self):
+        op = self._real_op
+
+        self.assertIs(op.T, op.T)
+        self.assertIs(op.T.T, op)
+
+    def test_adjoint_of_real_operator_is_transpose(self):
+        self.assertIs(self._real_op.H, self._real_op.T)
+
+    def test_adjoint_of_complex_operator(self):
+        import numpy as np
+
+        op = self._complex_op
+        vecs = np.random.rand(6, 3) + 1j * np.random.rand(6, 3)
+
+        self.assertIs(op.H.H, op)
+        self.assertAlmostEqual(np.linalg.norm(
+            op.H * vecs - self._complex_mat.conj().T.dot(vecs)), 0)
+
+
 class TestInverseSparseDiscreteBoundaryOperator(TestCase):
 
     requiresgmsh = unittest.skipIf(bempp.api.GMSH_PATH is None, reason="Needs GMSH")
@@ -266,6 +301,81 @@ class TestInverseSparseDiscreteBoundaryOperator(TestCase):
 
         self.assertAlmostEqual(np.linalg.norm(expected - actual), 0)
 
+    @requiresgmsh
+    def test_adjoint_of_inverse_reuses_factorization(self):
+        import bempp
+        import numpy as np
+        from scipy.sparse import csc_matrix
+
+        np.random.seed(0)
+        for rows, columns in [(6, 6), (8, 5), (5, 8)]:
+            mat = csc_matrix(np.random.rand(rows, columns) + 1j * np.random.rand(rows, columns))
+            inverse_op = bempp.api.InverseSparseDiscreteBoundaryOperator(mat)
+            adjoint = inverse_op.H
+
+            expected = np.linalg.pinv(mat.toarray()).conjugate().transpose()
+            vecs = np.random.rand(columns, 3)
+
+            self.assertIs(adjoint._inverse, inverse_op)
+            self.assertIs(adjoint.H, inverse_op)
+            self.assertAlmostEqual(np.linalg.norm(adjoint * vecs - expected.dot(vecs)), 0)
+            self.assertAlmostEqual(np.linalg.norm(adjoint * vecs[:, 0] - expected.dot(vecs[:, 0])), 0)
+
+class TestCuPyLinearOperator(TestCase):
+    """Test the GPU operator with a NumPy based stand-in for CuPy."""
+
+    def setUp(self):
+        import sys
+        import types
+        import numpy as np
+
+        self._device_copies = []
+
+        def asarray(array):
+            self._device_copies.append(array)
+            return np.array(array)
+
+        cupy = types.ModuleType('cupy')
+        cupy.asarray = asarray
+        cupy.asnumpy = np.asarray
+        cupy.matmul = np.matmul
+
+        self._saved_cupy = sys.modules.get('cupy')
+        sys.modules['cupy'] = cupy
+
+    def tearDown(self):
+        import sys
+
+        if self._saved_cupy is None:
+            del sys.modules['cupy']
+        else:
+            sys.modules['cupy'] = self._saved_cupy
+
+    def test_matmat_agrees_with_host_product(self):
+        import numpy as np
+        from bempp.api.assembly.discrete_boundary_operator import _CuPyLinearOperator
+
+        mat = np.random.rand(6, 4) + 1j * np.random.rand(6, 4)
+        op = _CuPyLinearOperator(mat)
+        x = np.random.rand(4, 3)
+
+        self.assertAlmostEqual(np.linalg.norm(op * x - mat.dot(x)), 0)
+        self.assertAlmostEqual(np.linalg.norm(op * x[:, 0] - mat.dot(x[:, 0])), 0)
+
+    def test_matrix_is_copied_to_device_once(self):
+        import numpy as np
+        from bempp.api.assembly.discrete_boundary_operator import _CuPyLinearOperator
+
+        mat = np.random.rand(6, 4)
+        op = _CuPyLinearOperator(mat)
+
+        self.assertEqual(len(self._device_copies), 0)
+        for _ in range(3):
+            op * np.random.rand(4, 2)
+
+        self.assertEqual(len([array for array in self._device_copies if array is mat]), 1)
+
+
 class TestZeroDiscreteBoundaryOperator(TestCase):
 
     def setUp(self):
@@ -290,6 +400,31 @@ class TestZeroDiscreteBoundaryOperator(TestCase):
         res = self._op * x.squeeze()
         self.assertEqual(res.shape, (self._M, ), "Multiply with array with ndim = 1.")
 
+    def test_multiply_with_matrix(self):
+
+        import numpy as np
+        x = np.ones((self._N, 3), dtype='float64')
+        res = self._op * x
+        self.assertEqual(res.shape, (self._M, 3))
+        self.assertEqual(np.count_nonzero(res), 0)
+
+
+class TestDiscreteRankOneOperator(TestCase):
+
+    def test_multiply_with_matrix(self):
+
+        import numpy as np
+        from bempp.api.assembly.discrete_boundary_operator import DiscreteRankOneOperator
+
+        column = np.random.rand(6)
+        row = np.random.rand(4) + 1j * np.random.rand(4)
+        op = DiscreteRankOneOperator(column, row)
+        x = np.random.rand(4, 3)
+
+        expected = np.outer(column, row).dot(x)
+        self.assertAlmostEqual(np.linalg.norm(op * x - expected), 0)
+        self.assertAlmostEqual(np.linalg.norm(op * x[:, 0] - expected[:, 0]), 0)
+
 
 
 
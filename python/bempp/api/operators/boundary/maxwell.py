@@ -1,12 +1,204 @@
 # pylint: disable-msg=too-many-arguments
+from bempp.api.assembly.boundary_operator import BoundaryOperator as _BoundaryOperator
+from bempp.api.utils.linear_operator import LinearOperator as _LinearOperator
+import numpy as _np
 
 """Definition of the Maxwell boundary operators."""
 
 
+class _EFIELinearOperator(_LinearOperator):
+    """Discrete electric field operator built from a single-layer operator.
+
+    The operator has the form sum_i T_i * S * R_i with
+    S = test_inverse * kernel * trial_inverse. All terms share the kernel,
+    so the trial operators are applied first and stacked into a block
+    right-hand side that is passed through the kernel only once.
+
+    """
+
+    def __init__(self, kernel, test_ops, trial_ops, test_inverse, trial_inverse):
+
+        self._kernel = kernel
+        self._test_ops = test_ops
+        self._trial_ops = trial_ops
+        self._test_inverse = test_inverse
+        self._trial_inverse = trial_inverse
+        self._adjoint_op = None
+
+        dtype = _np.result_type(kernel.dtype, *[op.dtype for op in test_ops + trial_ops])
+
+        super(_EFIELinearOperator, self).__init__(dtype=dtype,
+                                                  shape=(test_ops[0].shape[0], trial_ops[0].shape[1]))
+
+    def _matvec(self, x):
+        """Apply the operator with a single traversal of the kernel."""
+
+        return self._matmat(x.reshape(-1, 1)).reshape(-1)
+
+    def _matmat(self, mat):
+        """Apply the operator to all columns of mat with a single traversal of the kernel."""
+
+        columns = mat.shape[1]
+
+        # Column index * columns + j of the block belongs to term index
+        # and column j of mat.
+        block = _np.hstack([trial_op.matmat(mat) for trial_op in self._trial_ops])
+        block = self._test_inverse.matmat(self._kernel.matmat(self._trial_inverse.matmat(block)))
+
+        result = self._test_ops[0].matmat(block[:, :columns])
+        for index in range(1, len(self._test_ops)):
+            result += self._test_ops[index].matmat(
+                block[:, index * columns:(index + 1) * columns])
+        return result
+
+    def _rmatvec(self, x):
+        """Apply the adjoint operator."""
+
+        return self._adjoint().matvec(x)
+
+    def _adjoint(self):
+        """Return the adjoint, which has the same fused structure."""
+
+        if self._adjoint_op is None:
+            self._adjoint_op = _EFIELinearOperator(
+                self._kernel.H, [op.H for op in self._trial_ops], [op.H for op in self._test_ops],
+                self._trial_inverse.H, self._test_inverse.H)
+            self._adjoint_op._adjoint_op = self
+        return self._adjoint_op
+
+
+class _EFIEBoundaryOperator(_BoundaryOperator):
+    """Electric field operator represented through a Helmholtz single-layer operator."""
+
+    def __init__(self, slp, test_local_ops, trial_local_ops, coefficients,
+                 parameters=None, label="", use_gpu=False, kernel_dtype=None,
+                 private_slp=False):
+
+        super(_EFIEBoundaryOperator, self).__init__(trial_local_ops[0].domain,
+                                                    test_local_ops[0].range,
+                                                    test_local_ops[0].dual_to_range,
+                                                    label=label)
+
+        self._slp = slp
+        self._test_local_ops = test_local_ops
+        self._trial_local_ops = trial_local_ops
+        self._coefficients = coefficients
+        self._parameters = parameters
+        self._use_gpu = use_gpu
+        self._kernel_dtype = kernel_dtype
+        self._private_slp = private_slp
+
+    def _weak_form_impl(self):
+
+        from bempp.api.operators.boundary.sparse import identity
+        from bempp.api.assembly import InverseSparseDiscreteBoundaryOperator
+        from bempp.api.assembly import DenseDiscreteBoundaryOperator
+        from bempp.api.assembly.discrete_boundary_operator import _CuPyLinearOperator
+        from bempp.api.assembly.discrete_boundary_operator import _SinglePrecisionLinearOperator
+
+        if self._use_gpu:
+            # Fail before the single-layer operator is assembled.
+            import cupy # pylint: disable=unused-import
+
+        # The coefficients are folded into the sparse test operators once
+        # here instead of scaling vectors in every application.
+        test_discrete_ops = [coefficient * op.weak_form() for coefficient, op in
+                             zip(self._coefficients, self._test_local_ops)]
+
+        test_inverse = InverseSparseDiscreteBoundaryOperator(
+            identity(self._test_local_ops[0].domain, self._slp.domain,
+                     self._slp.dual_to_range,
+                     parameters=self._parameters).weak_form())
+        trial_inverse = InverseSparseDiscreteBoundaryOperator(
+            identity(self._slp.domain, self._slp.domain,
+                     self._trial_local_ops[0].dual_to_range,
+                     parameters=self._parameters).weak_form())
+
+        if self._private_slp:
+            # Nothing else uses the single-layer operator. Not caching its
+            # weak form avoids keeping the double precision matrix alive
+            # next to a single precision copy.
+            kernel = self._slp._weak_form_impl()
+        else:
+            kernel = self._slp.weak_form()
+        single_precision = self._kernel_dtype == _np.complex64
+        if self._use_gpu and not isinstance(kernel, DenseDiscreteBoundaryOperator):
+            raise ValueError("use_gpu requires a densely assembled single-layer operator.")
+        if single_precision and not isinstance(kernel, DenseDiscreteBoundaryOperator):
+            raise ValueError("dtype='complex64' requires a densely assembled single-layer operator.")
+        if isinstance(kernel, DenseDiscreteBoundaryOperator):
+            mat = kernel.A.astype(_np.complex64) if single_precision else kernel.A
+            if self._use_gpu:
+                kernel = _CuPyLinearOperator(mat)
+            elif single_precision:
+                kernel = DenseDiscreteBoundaryOperator(mat)
+            if single_precision:
+                kernel = _SinglePrecisionLinearOperator(kernel)
+
+        return _EFIELinearOperator(kernel, test_discrete_ops,
+                                   [op.weak_form() for op in self._trial_local_ops],
+                                   test_inverse, trial_inverse)
+
+
+def _efie_local_operators(slp_space, space, parameters):
+    """Return the test and trial local operators of the compound EFIE."""
+
+    from bempp.api.assembly import LocalBoundaryOperator
+    from bempp.api.assembly.abstract_boundary_operator import ElementaryAbstractLocalOperator
+    from bempp.core.operators.boundary.sparse import vector_value_times_scalar_ext
+    from bempp.core.operators.boundary.sparse import div_times_scalar_ext
+
+    slp_space_impl = slp_space._impl
+    space_impl = space._impl
+
+    # Definition of range_ does not matter in the local operators
+    test_local_ops = [LocalBoundaryOperator(ElementaryAbstractLocalOperator(
+        vector_value_times_scalar_ext(slp_space_impl, space_impl, space_impl, index)),
+            parameters=parameters, label='VECTOR_VALUE') for index in range(3)]
+    test_local_ops.append(LocalBoundaryOperator(ElementaryAbstractLocalOperator(
+        div_times_scalar_ext(slp_space_impl, space_impl, space_impl)),
+            parameters=parameters, label='DIV'))
+
+    # The transposes reuse the assembled weak forms of the test operators.
+    trial_local_ops = [op.transpose(space) for op in test_local_ops]  # Range parameter arbitrary
+
+    return test_local_ops, trial_local_ops
+
+
+def _cached_efie_local_operators(space, parameters):
+    """Return discontinuous space and local operators of the compound EFIE for space.
+
+    The local operators do not depend on the wave number. They are cached
+    on space for each set of quadrature settings, so that frequency sweeps
+    assemble them only once. The local operators keep a reference to the
+    mutable parameters, so their weak forms are assembled before they are
+    cached. Later changes to the parameters cannot alter a cached entry.
+
+    """
+
+    quadrature = parameters.quadrature
+    key = ('efie_local_operators',
+           quadrature.near.max_rel_dist, quadrature.near.single_order,
+           quadrature.near.double_order, quadrature.medium.max_rel_dist,
+           quadrature.medium.single_order, quadrature.medium.double_order,
+           quadrature.far.single_order, quadrature.far.double_order,
+           quadrature.double_singular)
+
+    cache = space._operator_cache
+    if key not in cache:
+        new_space = space.discontinuous_space
+        test_local_ops, trial_local_ops = _efie_local_operators(new_space, space, parameters)
+        for op in test_local_ops + trial_local_ops:
+            op.weak_form()
+        cache[key] = (new_space, test_local_ops, trial_local_ops)
+
+    return cache[key]
+
+
 def electric_field(domain, range_, dual_to_range,
                    wave_number,
                    label="EFIE", symmetry='no_symmetry',
-                   parameters=None, use_slp=False):
+                   parameters=None, use_slp=False, use_gpu=False, dtype=None):
     """Return the Maxwell electric field boundary operator.
 
     Parameters
@@ -40,6 +232,17 @@ def electric_field(domain, range_, dual_to_range,
         if no care is taken this option can lead to a wrong operator. Also,
         `use_slp=True` or `use_slp=op` is only valid if the `domain` and `dual_to_range`
         spaces are identical.
+    use_gpu : bool
+        If True, the products of the single-layer operator with the blocks
+        of vectors formed in each application are computed on a GPU. This
+        requires CuPy, `use_slp` and a densely assembled single-layer
+        operator.
+    dtype : string or numpy.dtype
+        Storage type of the single-layer operator if `use_slp` is set. With
+        'complex64' the single-layer operator is stored and applied in single
+        precision, while inputs and outputs remain in double precision. This
+        requires `use_slp` and a densely assembled single-layer operator. It is
+        meant for operators used as preconditioners. The default is 'complex128'.
 
 
     """
@@ -48,13 +251,32 @@ def electric_field(domain, range_, dual_to_range,
     from bempp.core.operators.boundary.maxwell import electric_field_ext
     from bempp.api.assembly import ElementaryBoundaryOperator
     from bempp.api.assembly.boundary_operator import BoundaryOperator
-    from bempp.api.assembly import LocalBoundaryOperator
     from bempp.api.assembly.abstract_boundary_operator import ElementaryAbstractIntegralOperator
-    from bempp.api.assembly.abstract_boundary_operator import ElementaryAbstractLocalOperator
 
     if parameters is None:
         parameters = bempp.api.global_parameters
 
+    if dtype is not None:
+        dtype = _np.dtype(dtype)
+        if dtype not in (_np.dtype('complex64'), _np.dtype('complex128')):
+            raise ValueError("dtype must be 'complex64' or 'complex128'.")
+
+    if use_gpu and not use_slp:
+        raise ValueError("use_gpu requires use_slp.")
+
+    single_precision = dtype == _np.dtype('complex64')
+
+    if single_precision and not use_slp:
+        raise ValueError("dtype='complex64' requires use_slp.")
+
+    if (single_precision and not isinstance(use_slp, BoundaryOperator) and
+            parameters.assembly.boundary_operator_assembly_type != 'dense'):
+        raise ValueError("dtype='complex64' requires dense assembly of the single-layer operator.")
+
+    if (use_gpu and not isinstance(use_slp, BoundaryOperator) and
+            parameters.assembly.boundary_operator_assembly_type != 'dense'):
+        raise ValueError("use_gpu requires dense assembly of the single-layer operator.")
+
     if not use_slp:
         return ElementaryBoundaryOperator( \
                 ElementaryAbstractIntegralOperator(
@@ -66,44 +288,25 @@ def electric_field(domain, range_, dual_to_range,
         space = domain
 
         if not isinstance(use_slp, BoundaryOperator):
-
-            new_space = space.discontinuous_space
+            new_space, test_local_ops, trial_local_ops = _cached_efie_local_operators(
+                space, parameters)
             slp = bempp.api.operators.boundary.helmholtz.single_layer(new_space, new_space, new_space, wave_number,
                                                                   parameters=parameters)
         else:
             slp = use_slp
-
-        test_local_ops = []
-        trial_local_ops = []
-
-        from bempp.api.assembly.boundary_operator import CompoundBoundaryOperator
-        from bempp.core.operators.boundary.sparse import vector_value_times_scalar_ext
-        from bempp.core.operators.boundary.sparse import div_times_scalar_ext
+            test_local_ops, trial_local_ops = _efie_local_operators(slp.dual_to_range, space,
+                                                                    parameters)
 
         kappa = -1.j * wave_number
+        kappa_inverse = 1. / kappa
 
-        for index in range(3):
-            # Definition of range_ does not matter in next operator
-            test_local_op = LocalBoundaryOperator(ElementaryAbstractLocalOperator(
-                vector_value_times_scalar_ext(slp.dual_to_range._impl, space._impl, space._impl, index)),
-                    label='VECTOR_VALUE')
-            test_local_ops.append(test_local_op)
-            trial_local_ops.append(test_local_op.transpose(space))  # Range parameter arbitrary
-
-        term1 = CompoundBoundaryOperator(test_local_ops, kappa * slp, trial_local_ops, label=label+"_term1")
-
-        test_local_ops = []
-        trial_local_ops = []
-
-        div_op = LocalBoundaryOperator(ElementaryAbstractLocalOperator(div_times_scalar_ext(slp.dual_to_range._impl, space._impl, space._impl)),
-            label='DIV')
-        div_op_transpose = div_op.transpose(space) # Range space does not matter
-
-        term2 = CompoundBoundaryOperator([div_op], (1. / kappa) * slp,
-                                         [div_op_transpose], label=label+"_term2")
-
-        return term1 + term2
-
+        # Both EFIE terms share the single-layer operator and are applied
+        # together with one kernel traversal.
+        return _EFIEBoundaryOperator(slp, test_local_ops, trial_local_ops,
+                                     [kappa, kappa, kappa, kappa_inverse],
+                                     parameters=parameters, label=label,
+                                     use_gpu=use_gpu, kernel_dtype=dtype,
+                                     private_slp=slp is not use_slp)
 
 def magnetic_field(domain, range_, dual_to_range,
                    wave_number,
@@ -231,8 +231,8 @@ def hypersingular(domain, range_, dual_to_range, wave_number,
             test_local_ops.append(test_local_op)
             trial_local_ops.append(test_local_op.transpose(range_))  # Range parameter arbitrary
 
-        term2 = (wave_number * wave_number) * CompoundBoundaryOperator(test_local_ops, slp, trial_local_ops,
-                                                                       label=label + "_term2")
+        term2 = CompoundBoundaryOperator(test_local_ops, slp, trial_local_ops,
+                                         label=label + "_term2", scale=wave_number * wave_number)
 
         return term1 + term2
 
@@ -30,6 +30,174 @@ class TestMaxwell(TestCase):
 
         self.assertAlmostEqual(np.linalg.norm(mat1 - mat2) / np.linalg.norm(mat1), 0)
 
+    def test_compound_electric_field_operator_for_several_wave_numbers(self):
+        from bempp.api.operators.boundary.maxwell import electric_field
+        import numpy as np
+
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'dense'
+
+        for wave_number in [WAVE_NUMBER, 2.5]:
+            standard_efie = electric_field(self._space, self._space, self._space,
+                                           wave_number,
+                                           parameters=parameters).weak_form()
+            compound_efie = electric_field(self._space, self._space, self._space,
+                                           wave_number,
+                                           parameters=parameters, use_slp=True).weak_form()
+
+            mat1 = bempp.api.as_matrix(standard_efie)
+            mat2 = bempp.api.as_matrix(compound_efie)
+
+            self.assertAlmostEqual(np.linalg.norm(mat1 - mat2) / np.linalg.norm(mat1), 0)
+
+    def test_compound_electric_field_operator_reuses_local_operators(self):
+        from bempp.api.operators.boundary.maxwell import electric_field
+
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'dense'
+
+        first = electric_field(self._space, self._space, self._space, WAVE_NUMBER,
+                               parameters=parameters, use_slp=True)
+        second = electric_field(self._space, self._space, self._space, 2.5,
+                                parameters=parameters, use_slp=True)
+
+        self.assertIs(first._test_local_ops, second._test_local_ops)
+        self.assertIs(first._trial_local_ops, second._trial_local_ops)
+
+        parameters.quadrature.near.double_order += 1
+        third = electric_field(self._space, self._space, self._space, WAVE_NUMBER,
+                               parameters=parameters, use_slp=True)
+
+        self.assertIsNot(first._test_local_ops, third._test_local_ops)
+        self.assertIs(third._test_local_ops[0].parameters, parameters)
+
+    def test_cached_local_operators_are_assembled_with_the_cached_settings(self):
+        from bempp.api.operators.boundary.maxwell import electric_field
+
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'dense'
+
+        efie = electric_field(self._space, self._space, self._space, WAVE_NUMBER,
+                              parameters=parameters, use_slp=True)
+
+        for op in efie._test_local_ops + efie._trial_local_ops:
+            self.assertIsNotNone(op._weak_form)
+
+        weak_forms = [op.weak_form() for op in efie._test_local_ops]
+        parameters.quadrature.near.double_order += 1
+
+        for op, weak_form in zip(efie._test_local_ops, weak_forms):
+            self.assertIs(op.weak_form(), weak_form)
+
+    def test_cached_local_operators_do_not_keep_space_alive(self):
+        from bempp.api.operators.boundary.maxwell import electric_field
+        import gc
+        import weakref
+
+        space = bempp.api.function_space(self._space.grid, "RT", 0)
+        electric_field(space, space, space, WAVE_NUMBER, use_slp=True)
+        space_ref = weakref.ref(space)
+
+        del space
+        gc.collect()
+
+        self.assertIsNone(space_ref())
+
+    def test_single_precision_compound_electric_field_operator(self):
+        from bempp.api.operators.boundary.maxwell import electric_field
+        import numpy as np
+
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'dense'
+
+        compound_efie = electric_field(self._space, self._space, self._space,
+                                       WAVE_NUMBER,
+                                       parameters=parameters, use_slp=True).weak_form()
+        single_efie = electric_field(self._space, self._space, self._space,
+                                     WAVE_NUMBER, parameters=parameters,
+                                     use_slp=True, dtype='complex64').weak_form()
+
+        mat1 = bempp.api.as_matrix(compound_efie)
+        mat2 = bempp.api.as_matrix(single_efie)
+
+        self.assertEqual(mat2.dtype, np.complex128)
+        self.assertLess(np.linalg.norm(mat1 - mat2) / np.linalg.norm(mat1), 1E-5)
+
+    def test_single_precision_compound_electric_field_operator_stores_one_matrix(self):
+        from bempp.api.operators.boundary.maxwell import electric_field
+        import numpy as np
+
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'dense'
+
+        single_efie = electric_field(self._space, self._space, self._space,
+                                     WAVE_NUMBER, parameters=parameters,
+                                     use_slp=True, dtype='complex64')
+        discrete_op = single_efie.weak_form()
+
+        self.assertIsNone(single_efie._slp._weak_form)
+        self.assertEqual(discrete_op._kernel._operator.A.dtype, np.complex64)
+
+    def test_gpu_electric_field_operator_requires_dense_compound_representation(self):
+        from bempp.api.operators.boundary.maxwell import electric_field
+
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'hmat'
+
+        with self.assertRaises(ValueError):
+            electric_field(self._space, self._space, self._space, WAVE_NUMBER,
+                           parameters=parameters, use_gpu=True)
+        with self.assertRaises(ValueError):
+            electric_field(self._space, self._space, self._space, WAVE_NUMBER,
+                           parameters=parameters, use_slp=True, use_gpu=True)
+
+    def test_single_precision_electric_field_operator_requires_dense_compound_representation(self):
+        from bempp.api.operators.boundary.maxwell import electric_field
+
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'dense'
+
+        with self.assertRaises(ValueError):
+            electric_field(self._space, self._space, self._space, WAVE_NUMBER,
+                           parameters=parameters, dtype='complex64')
+
+        parameters.assembly.boundary_operator_assembly_type = 'hmat'
+
+        with self.assertRaises(ValueError):
+            electric_field(self._space, self._space, self._space, WAVE_NUMBER,
+                           parameters=parameters, use_slp=True, dtype='complex64')
+
+    def test_single_precision_electric_field_operator_with_hmat_single_layer_operator(self):
+        from bempp.api.operators.boundary.maxwell import electric_field
+
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'hmat'
+
+        space = self._space.discontinuous_space
+        slp = bempp.api.operators.boundary.helmholtz.single_layer(space, space, space, WAVE_NUMBER,
+                                                                  parameters=parameters)
+        efie = electric_field(self._space, self._space, self._space, WAVE_NUMBER,
+                              parameters=parameters, use_slp=slp, dtype='complex64')
+
+        with self.assertRaises(ValueError):
+            efie.weak_form()
+
+    def test_adjoint_of_compound_electric_field_operator(self):
+        from bempp.api.operators.boundary.maxwell import electric_field
+        import numpy as np
+
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'dense'
+
+        compound_efie = electric_field(self._space, self._space, self._space,
+                                       WAVE_NUMBER,
+                                       parameters=parameters, use_slp=True).weak_form()
+
+        mat = bempp.api.as_matrix(compound_efie)
+        mat_adjoint = bempp.api.as_matrix(compound_efie.H)
+
+        self.assertAlmostEqual(np.linalg.norm(mat.conj().T - mat_adjoint) / np.linalg.norm(mat), 0)
+
 
 if __name__ == "__main__":
     from unittest import main
@@ -34,6 +34,10 @@ class Space(object):
     
     def __init__(self, impl):
         self._impl = impl
+        # Operators that only depend on this space, e.g. the local operators
+        # of the compound electric field operator. They are freed together
+        # with the space.
+        self._operator_cache = {}
 
     def __eq__(self, other):
         return self.is_identical(other)
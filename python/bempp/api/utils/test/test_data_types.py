@@ -0,0 +1,25 @@
+from unittest import TestCase
+import numpy as np
+
+
+class TestDataTypes(TestCase):
+
+    def test_combined_type(self):
+        from bempp.api.utils.data_types import combined_type
+
+        self.assertEqual(combined_type('float32', 'float64'), np.float64)
+        self.assertEqual(combined_type('float32', 'complex64'), np.complex64)
+        self.assertEqual(combined_type('float64', 'complex64'), np.complex128)
+        self.assertEqual(combined_type(np.dtype('complex128'), 'float32'), np.complex128)
+
+    def test_combined_type_rejects_unsupported_types(self):
+        from bempp.api.utils.data_types import combined_type
+
+        with self.assertRaises(ValueError):
+            combined_type('int32', 'float64')
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()